@@ -9,14 +9,6 @@ __version__ = "2.0.1"
 __author__ = "VMBalancer Team"
 __email__ = "support@vmbalancer.com"
 
-from .api.client import VMManagerAPI
-from .core.balancer import VMBalancer
-from .models.cluster import ClusterInfo
-from .models.node import NodeInfo
-from .models.vm import VMInfo
-from .monitoring.ssh import SSHMonitor
-from .notifications.telegram import TelegramNotifier
-
 __all__ = [
     "VMBalancer",
     "VMManagerAPI",
@@ -26,3 +18,25 @@ __all__ = [
     "TelegramNotifier",
     "SSHMonitor",
 ]
+
+# Public classes are imported lazily (PEP 562) so that lightweight CLI
+# invocations (--help, --version) do not pay for requests/asyncssh imports
+_LAZY_IMPORTS = {
+    "VMBalancer": ".core.balancer",
+    "VMManagerAPI": ".api.client",
+    "ClusterInfo": ".models.cluster",
+    "NodeInfo": ".models.node",
+    "VMInfo": ".models.vm",
+    "TelegramNotifier": ".notifications.telegram",
+    "SSHMonitor": ".monitoring.ssh",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,59 @@ VMManager 6 API client
 """
 
 import logging
+import re
 import time
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..models.cluster import ClusterInfo
 from ..models.node import NodeInfo
 from ..models.vm import VMInfo
 
+# Matches the numeric part of version strings like "6.2.0" or "7.1.0-1ubuntu1"
+_QEMU_VERSION_RE = re.compile(r"(\d+(?:\.\d+)*)")
+
+
+@lru_cache(maxsize=256)
+def _parse_qemu_version(version_str: str) -> Tuple[int, ...]:
+    """Parse a QEMU version string into a comparable tuple
+
+    Cached: a cluster only has a handful of distinct version strings, yet
+    the comparison runs for every (VM, candidate node) pair per cycle.
+    """
+    numeric_part = _QEMU_VERSION_RE.match(version_str.strip())
+    if numeric_part:
+        return tuple(map(int, numeric_part.group(1).split(".")))
+    return (0,)
+
+
+@lru_cache(maxsize=256)
+def _qemu_versions_compatible(source_version: str, target_version: str) -> bool:
+    """Compare two parsed QEMU versions, memoized on the string pair
+
+    The acceptance checks ask the same node-pair questions over and over
+    within a cycle; caching on the raw pair skips even the tuple compare
+    after the first occurrence.
+    """
+    source_parsed = _parse_qemu_version(source_version)
+    target_parsed = _parse_qemu_version(target_version)
+
+    # Target version should be >= source version
+    is_compatible = target_parsed >= source_parsed
+
+    logging.debug(
+        f"QEMU version comparison: source={source_version} ({source_parsed}) vs"
+        f" target={target_version} ({target_parsed}) -"
+        f" compatible={is_compatible}"
+    )
+
+    return is_compatible
+
 
 class VMManagerAPI:
     """VMManager 6 API client"""
@@ -25,27 +69,56 @@ class VMManagerAPI:
         self.verify_ssl = verify_ssl
         self.session = requests.Session()
         self.session.verify = verify_ssl
-        self.token = None
+        self.token: Optional[str] = None
+
+        # Larger keep-alive pool than the requests default (10) so concurrent
+        # migrations/job polling reuse TCP+TLS connections, plus retries on
+        # transient gateway errors instead of failing the whole cycle
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         # Set default headers
         self.session.headers.update(
             {"Accept": "application/json", "Content-Type": "application/json"}
         )
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Issue an API request with the auth token attached per call
+
+        The token travels with each request instead of being written into
+        the shared session headers, so a re-authentication (possibly from
+        another thread) can never interleave with in-flight requests.
+        """
+        if self.token:
+            kwargs.setdefault("headers", {}).setdefault("x-xsrf-token", self.token)
+        return self.session.request(method, url, **kwargs)
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        return self._request("GET", url, **kwargs)
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        return self._request("POST", url, **kwargs)
+
     def authenticate(self) -> bool:
         """Authenticate with VMManager and get token"""
         try:
             auth_url = f"{self.host}/auth/v4/public/token"
             auth_data = {"email": self.username, "password": self.password}
 
-            response = self.session.post(auth_url, json=auth_data)
+            response = self._post(auth_url, json=auth_data)
             response.raise_for_status()
 
             auth_result = response.json()
             self.token = auth_result.get("token")
 
             if self.token:
-                self.session.headers.update({"x-xsrf-token": self.token})
                 logging.info("Successfully authenticated with VMManager")
                 return True
             else:
@@ -60,7 +133,7 @@ class VMManagerAPI:
         """Check if VMManager API is accessible"""
         try:
             url = f"{self.host}/vm/v3/cluster"
-            response = self.session.get(url)
+            response = self._get(url)
             response.raise_for_status()
 
             # If we can get clusters list, API is accessible
@@ -77,7 +150,7 @@ class VMManagerAPI:
         """Get list of all clusters"""
         try:
             url = f"{self.host}/vm/v3/cluster"
-            response = self.session.get(url)
+            response = self._get(url)
             response.raise_for_status()
 
             clusters_response = response.json()
@@ -89,16 +162,18 @@ class VMManagerAPI:
             else:
                 clusters_data = clusters_response
 
+            # Fetch the node list once and bucket it by cluster, instead of
+            # downloading the same global payload again for every cluster
+            nodes_by_cluster = self.get_nodes_by_cluster()
+
             for cluster_data in clusters_data:
+                cluster_id = str(cluster_data["id"])
                 cluster = ClusterInfo(
-                    id=str(cluster_data["id"]),
+                    id=cluster_id,
                     name=cluster_data["name"],
-                    nodes=[],
+                    nodes=nodes_by_cluster.get(cluster_id, []),
                     balancer_enabled=True,  # External balancer works for all clusters
                 )
-
-                # Get nodes for this cluster
-                cluster.nodes = self.get_cluster_nodes(cluster.id)
                 clusters.append(cluster)
 
             return clusters
@@ -107,17 +182,45 @@ class VMManagerAPI:
             logging.error(f"Failed to get clusters: {e}")
             return []
 
-    def get_cluster_nodes(self, cluster_id: str) -> List[NodeInfo]:
-        """Get nodes for specific cluster"""
+    @staticmethod
+    def _parse_node(node_data: Dict) -> NodeInfo:
+        """Build a NodeInfo from a raw /vm/v3/node entry"""
+        # Unpack the nested sections once instead of chaining .get() per field
+        cpu_data = node_data.get("cpu") or {}
+        ram_data = node_data.get("ram_mib") or {}
+        vm_data = node_data.get("vm") or {}
+        return NodeInfo(
+            id=str(node_data["id"]),
+            name=node_data["name"],
+            cpu_total=cpu_data.get("number", 0),
+            cpu_used=cpu_data.get("used", 0),
+            memory_total_mb=ram_data.get("total", 0),
+            memory_used_mb=ram_data.get("allocated", 0),
+            vm_count=vm_data.get("total", 0),
+            is_maintenance=node_data.get("maintenance_mode", False)
+            or node_data.get("maintenance", False),
+            vm_creation_allowed=not node_data.get("host_creation_blocked", False),
+            vm_limit=node_data.get("host_limit", 0),
+            qemu_version=node_data.get("qemu_version", ""),
+            # SSH parameters from API
+            ssh_host=node_data.get("ip"),  # Use node IP for SSH connection
+            ssh_port=node_data.get("port", 22),  # SSH port from API, default to 22
+            ssh_user=node_data.get("ssh_user"),  # SSH user from API
+        )
+
+    def get_nodes_by_cluster(self) -> Dict[str, List[NodeInfo]]:
+        """Get all nodes in a single API call, bucketed by cluster id
+
+        /vm/v3/node only serves the full global list (server-side filtering
+        causes 500 errors), so one fetch bucketed client-side replaces one
+        identical download and parse per cluster.
+        """
         try:
-            # Get all nodes and filter by cluster_id on client side
-            # Server-side filtering seems to cause 500 errors
             url = f"{self.host}/vm/v3/node"
-            response = self.session.get(url)
+            response = self._get(url)
             response.raise_for_status()
 
             nodes_response = response.json()
-            nodes = []
 
             # API returns object with 'list' field containing nodes array
             if isinstance(nodes_response, dict) and "list" in nodes_response:
@@ -125,53 +228,34 @@ class VMManagerAPI:
             else:
                 nodes_data = nodes_response
 
+            nodes_by_cluster: Dict[str, List[NodeInfo]] = defaultdict(list)
             for node_data in nodes_data:
-                # Filter by cluster_id on client side
-                if str(node_data.get("cluster", {}).get("id", "")) != cluster_id:
-                    continue
-
-                # Get detailed node statistics from the node data itself
-                node = NodeInfo(
-                    id=str(node_data["id"]),
-                    name=node_data["name"],
-                    cpu_total=node_data.get("cpu", {}).get("number", 0),
-                    cpu_used=node_data.get("cpu", {}).get("used", 0),
-                    memory_total_mb=node_data.get("ram_mib", {}).get("total", 0),
-                    memory_used_mb=node_data.get("ram_mib", {}).get("allocated", 0),
-                    vm_count=node_data.get("vm", {}).get("total", 0),
-                    is_maintenance=node_data.get("maintenance_mode", False)
-                    or node_data.get("maintenance", False),
-                    vm_creation_allowed=not node_data.get(
-                        "host_creation_blocked", False
-                    ),
-                    vm_limit=node_data.get("host_limit", 0),
-                    qemu_version=node_data.get("qemu_version", ""),
-                    # SSH parameters from API
-                    ssh_host=node_data.get("ip"),  # Use node IP for SSH connection
-                    ssh_port=node_data.get(
-                        "port", 22
-                    ),  # SSH port from API, default to 22
-                    ssh_user=node_data.get("ssh_user"),  # SSH user from API
-                )
-                nodes.append(node)
+                cluster_data = node_data.get("cluster") or {}
+                cluster_id = str(cluster_data.get("id", ""))
+                nodes_by_cluster[cluster_id].append(self._parse_node(node_data))
 
-            return nodes
+            return dict(nodes_by_cluster)
 
         except Exception as e:
             logging.error(f"Failed to get cluster nodes: {e}")
-            return []
+            return {}
 
-    def get_cluster_vms(self, cluster_id: str) -> List[VMInfo]:
-        """Get virtual machines in cluster"""
+    def get_cluster_nodes(self, cluster_id: str) -> List[NodeInfo]:
+        """Get nodes for specific cluster"""
+        return self.get_nodes_by_cluster().get(cluster_id, [])
+
+    def get_vms_by_cluster(self) -> Dict[str, List[VMInfo]]:
+        """Get all virtual machines in a single API call, bucketed by cluster id
+
+        Mirrors get_nodes_by_cluster: /vm/v3/host only serves the global VM
+        list, so it is fetched and parsed once per cycle.
+        """
         try:
-            # Get all VMs and filter by cluster_id on client side
-            # Server-side filtering seems to cause 500 errors
             url = f"{self.host}/vm/v3/host"
-            response = self.session.get(url)
+            response = self._get(url)
             response.raise_for_status()
 
             vms_response = response.json()
-            vms = []
 
             # API returns object with 'list' field containing VMs array
             if isinstance(vms_response, dict) and "list" in vms_response:
@@ -179,9 +263,7 @@ class VMManagerAPI:
             else:
                 vms_data = vms_response
 
-            logging.debug(
-                f"Retrieved {len(vms_data)} VMs from API for cluster {cluster_id}"
-            )
+            logging.debug(f"Retrieved {len(vms_data)} VMs from API")
 
             # Debug: log a sample VM to understand the structure
             if vms_data and len(vms_data) > 0:
@@ -198,37 +280,35 @@ class VMManagerAPI:
                                 f"Found cluster-related field: {key} = {sample_vm[key]}"
                             )
 
-            filtered_count = 0
+            vms_by_cluster: Dict[str, List[VMInfo]] = defaultdict(list)
             for vm_data in vms_data:
-                # Filter by cluster_id on client side
                 # The cluster data is in vm_data['cluster']['id'], not vm_data['cluster_id']
-                cluster_data = vm_data.get("cluster", {})
+                cluster_data = vm_data.get("cluster") or {}
                 vm_cluster_id = str(cluster_data.get("id", ""))
-                if vm_cluster_id != cluster_id:
-                    continue
-
-                filtered_count += 1
-
-                # Check if VM can be migrated
-                can_migrate = self.can_vm_migrate(vm_data)
+                node_data = vm_data.get("node") or {}
 
                 vm = VMInfo(
                     id=str(vm_data["id"]),
                     name=vm_data["name"],
-                    node_id=str(vm_data.get("node", {}).get("id", "")),
+                    node_id=str(node_data.get("id", "")),
                     cpu_cores=vm_data.get("cpu_number", 0),
                     memory_mb=vm_data.get("ram_mib", 0),
                     state=vm_data.get("state", "unknown"),
-                    can_migrate=can_migrate,
+                    can_migrate=self.can_vm_migrate(vm_data),
                 )
-                vms.append(vm)
+                vms_by_cluster[vm_cluster_id].append(vm)
 
-            logging.debug(f"Filtered {filtered_count} VMs for cluster {cluster_id}")
-            return vms
+            return dict(vms_by_cluster)
 
         except Exception as e:
             logging.error(f"Failed to get cluster VMs: {e}")
-            return []
+            return {}
+
+    def get_cluster_vms(self, cluster_id: str) -> List[VMInfo]:
+        """Get virtual machines in cluster"""
+        vms = self.get_vms_by_cluster().get(cluster_id, [])
+        logging.debug(f"Filtered {len(vms)} VMs for cluster {cluster_id}")
+        return vms
 
     def can_vm_migrate(self, vm_data: Dict) -> bool:
         """Check if VM can be migrated"""
@@ -281,22 +361,29 @@ class VMManagerAPI:
             logging.debug(f"Migration URL: {url}")
             logging.debug(f"Migration data: {migrate_data}")
 
-            response = self.session.post(url, json=migrate_data)
+            response = self._post(url, json=migrate_data)
 
             # Log response details for debugging
             logging.debug(f"Migration response status: {response.status_code}")
             logging.debug(f"Migration response headers: {dict(response.headers)}")
 
+            # Decode the body once and reuse it below instead of calling
+            # response.json() a second time for the task id
             try:
                 response_data = response.json()
-                logging.debug(f"Migration response body: {response_data}")
+                logging.debug("Migration response body: %s", response_data)
             except ValueError:
-                logging.debug(f"Migration response text: {response.text}")
+                response_data = None
+                logging.debug("Migration response text: %s", response.text)
 
             response.raise_for_status()
 
+            if not isinstance(response_data, dict) or "id" not in response_data:
+                logging.error(f"Unexpected migration response for VM {vm_id}")
+                return False
+
             # Get job ID to track migration progress
-            vm_id = str(response.json()["id"])
+            vm_id = str(response_data["id"])
             if job_id := self.get_job_id(vm_id):
                 return self.wait_for_job_completion(job_id, timeout)
             else:
@@ -311,7 +398,7 @@ class VMManagerAPI:
         """Get job ID for specific VM"""
         try:
             url = f"{self.host}/vm/v3/host/{vm_id}/history"
-            response = self.session.get(url)
+            response = self._get(url)
             response.raise_for_status()
             history_data = response.json()
             max_id = history_data["max_id"]
@@ -371,23 +458,25 @@ class VMManagerAPI:
         """Wait for job completion with timeout"""
         try:
             url = f"{self.host}/vm/v3/task/{job_id}"
-            start_time = time.time()
+            # Monotonic clock: timeout math must not jump with NTP adjustments
+            start_time = time.monotonic()
             last_progress_log = 0
+            poll_delay = 1.0
 
             logging.info(
                 f"Waiting for migration job {job_id} to complete (timeout:"
                 f" {timeout//60} minutes)"
             )
 
-            while time.time() - start_time < timeout:
-                response = self.session.get(url)
+            while time.monotonic() - start_time < timeout:
+                response = self._get(url)
                 response.raise_for_status()
 
                 job_data = response.json()
                 status = job_data.get("task", {}).get("status", "").lower()
 
                 if status == "complete":
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     logging.info(
                         f"Migration job {job_id} completed successfully in"
                         f" {elapsed:.1f} seconds"
@@ -399,7 +488,7 @@ class VMManagerAPI:
                     return False
 
                 # Log progress every 60 seconds for long-running migrations
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed - last_progress_log >= 60:
                     status_info = job_data.get("task", {}).get("status", "unknown")
                     logging.info(
@@ -408,7 +497,10 @@ class VMManagerAPI:
                     )
                     last_progress_log = elapsed
 
-                time.sleep(5)  # Wait 5 seconds before next check
+                # Back off between checks: short jobs are detected within a
+                # second or two, long ones are polled at most every 10 seconds
+                time.sleep(poll_delay)
+                poll_delay = min(poll_delay * 1.5, 10.0)
 
             logging.warning(f"Job {job_id} timed out after {timeout} seconds")
             return False
@@ -430,29 +522,7 @@ class VMManagerAPI:
             )
 
         try:
-            # Parse version strings like "6.2.0" or "7.1.0-1ubuntu1"
-            def parse_version(version_str: str) -> Tuple[int, ...]:
-                # Extract just the numeric part (before any non-numeric characters)
-                import re
-
-                numeric_part = re.match(r"(\d+(?:\.\d+)*)", version_str.strip())
-                if numeric_part:
-                    return tuple(map(int, numeric_part.group(1).split(".")))
-                return (0,)
-
-            source_parsed = parse_version(source_version)
-            target_parsed = parse_version(target_version)
-
-            # Target version should be >= source version
-            is_compatible = target_parsed >= source_parsed
-
-            logging.debug(
-                f"QEMU version comparison: source={source_version} ({source_parsed}) vs"
-                f" target={target_version} ({target_parsed}) -"
-                f" compatible={is_compatible}"
-            )
-
-            return is_compatible
+            return _qemu_versions_compatible(source_version, target_version)
 
         except Exception as e:
             logging.warning(
@@ -4,9 +4,14 @@ Core VM Balancer implementation
 
 import asyncio
 import logging
+import signal
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 from ..api.client import VMManagerAPI
 from ..models.cluster import ClusterInfo
@@ -16,6 +21,56 @@ from ..monitoring.ssh import SSHMonitor
 from ..notifications.telegram import TelegramNotifier
 from ..utils.i18n import t
 
+try:
+    # Optional fast path for very large clusters; the balancer works fine
+    # without NumPy installed
+    import numpy as np
+except ImportError:
+    np = None
+
+# Minimum node count before the vectorized analyzers pay off
+_VECTORIZE_MIN_NODES = 128
+
+# Retention windows for migration tracking, in seconds
+_RECENT_MIGRATION_RETENTION = 3600.0  # Skip VMs migrated within the last hour
+_BLACKLIST_RETENTION = 24 * 3600.0  # Skip VMs that failed within 24 hours
+
+
+class ClusterStateCache:
+    """TTL cache for cluster/VM snapshots fetched from VMManager
+
+    The cycle cost is dominated by the REST round-trips, so when cycles run
+    close together (short intervals, adaptive polling) the previous snapshot
+    is reused until it ages past the TTL or a migration invalidates it.
+    A TTL of 0 disables caching.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, object]] = {}
+
+    def get_or_fetch(self, key: str, fetch_fn):
+        """Return the cached value for key, refetching when stale"""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            logging.debug("Using cached %s state", key)
+            return entry[1]
+        value = fetch_fn()
+        self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop all cached state (called after a successful migration)"""
+        self._entries.clear()
+
+
+def group_vms_by_node(vms: List[VMInfo]) -> Dict[str, List[VMInfo]]:
+    """Partition VMs by their node id in a single pass"""
+    vms_by_node: Dict[str, List[VMInfo]] = defaultdict(list)
+    for vm in vms:
+        vms_by_node[vm.node_id].append(vm)
+    return vms_by_node
+
 
 class VMBalancer:
     """Main balancer logic"""
@@ -58,15 +113,24 @@ class VMBalancer:
 
         # Set configuration parameters
         self.balance_interval = self.config.balance_interval
+        self.min_balance_interval = self.config.min_balance_interval
+        self.max_balance_interval = self.config.max_balance_interval
         self.cluster_ids = self.config.cluster_ids
         self.cpu_overload_threshold = self.config.cpu_overload_threshold
         self.memory_overload_threshold = self.config.memory_overload_threshold
         self.cpu_target_threshold = self.config.cpu_target_threshold
         self.memory_target_threshold = self.config.memory_target_threshold
-        self.excluded_source_nodes = set(self.config.exclude_source_nodes)
-        self.excluded_target_nodes = set(self.config.exclude_target_nodes)
+        self.excluded_source_nodes = frozenset(self.config.exclude_source_nodes)
+        self.excluded_target_nodes = frozenset(self.config.exclude_target_nodes)
+        # Joined once for logging; the sets never change during a run
+        self._excluded_source_str = ", ".join(sorted(self.excluded_source_nodes))
+        self._excluded_target_str = ", ".join(sorted(self.excluded_target_nodes))
         self.max_migrations_per_cycle = self.config.max_migrations_per_cycle
         self.migration_timeout = self.config.migration_timeout
+        self.state_ttl = self.config.state_ttl
+        self.max_parallel_clusters = self.config.max_parallel_clusters
+        self.migration_parallelism = self.config.migration_parallelism
+        self.max_vm_memory_to_migrate_mb = self.config.max_vm_memory_to_migrate_mb
 
         # SSH configuration
         self.ssh_enabled = self.config.ssh_enabled
@@ -90,11 +154,47 @@ class VMBalancer:
                 hosts_mapping=self.config.ssh_hosts_mapping,
             )
 
-        # Internal state
-        self.migration_history = {}  # Track recent migrations
-        self.migration_blacklist = (
+        # Internal state (vm_id -> time.monotonic() timestamp)
+        self.migration_history: Dict[str, float] = {}  # Track recent migrations
+        self.migration_blacklist: Dict[str, float] = (
             {}
         )  # Track failed/timeout migrations to prevent retries
+        self._stop_event: Optional[asyncio.Event] = None  # Created in run()
+        self._migration_semaphore: Optional[asyncio.Semaphore] = None
+        # Per-thread cluster context (node-id index), rebuilt by
+        # prepare_nodes(); thread-local so clusters can balance in parallel
+        self._cluster_context = threading.local()
+        # Guards the migration trackers when clusters balance concurrently
+        self._history_lock = threading.Lock()
+        self._state_cache = ClusterStateCache(self.state_ttl)
+
+        # Per-cycle timestamp cache, refreshed by begin_cycle()
+        self.begin_cycle()
+
+    def begin_cycle(self) -> None:
+        """Refresh the per-cycle timestamp and retention cutoffs
+
+        Migration tracking uses time.monotonic() floats: they are immune to
+        wall-clock jumps and comparisons are single C-level float compares.
+        The timestamp and cutoffs are computed once per cycle instead of for
+        every candidate VM in select_vm_for_migration.
+        """
+        self._cycle_started = time.monotonic()
+        self._recent_cutoff = self._cycle_started - _RECENT_MIGRATION_RETENTION
+        self._blacklist_cutoff = self._cycle_started - _BLACKLIST_RETENTION
+
+        # Evict expired entries so the dicts stay small, then snapshot the
+        # still-active VM ids: the candidate filters become one O(1) set
+        # membership test per VM instead of a dict lookup plus a compare
+        for tracker, cutoff in (
+            (self.migration_history, self._recent_cutoff),
+            (self.migration_blacklist, self._blacklist_cutoff),
+        ):
+            stale = [vm_id for vm_id, ts in tracker.items() if ts < cutoff]
+            for vm_id in stale:
+                del tracker[vm_id]
+        self._recently_migrated_ids = set(self.migration_history)
+        self._blacklisted_ids = set(self.migration_blacklist)
 
     def filter_clusters(self, clusters: List[ClusterInfo]) -> List[ClusterInfo]:
         """Filter clusters based on cluster_ids if specified"""
@@ -114,23 +214,123 @@ class VMBalancer:
 
         return filtered
 
+    def prepare_nodes(self, nodes: List[NodeInfo]) -> None:
+        """Precompute per-node exclusion flags and the node-id index
+
+        Resolving each node against the exclusion sets once per cycle turns
+        the two hash lookups per node in the analyzer loops into a single
+        attribute read; the id index gives get_source_node_for_vm O(1)
+        lookups during acceptance checks.
+        """
+        self._cluster_context.node_by_id = {node.id: node for node in nodes}
+        excluded_source = self.excluded_source_nodes
+        excluded_target = self.excluded_target_nodes
+        for node in nodes:
+            node.excluded_source = (
+                node.name in excluded_source or node.id in excluded_source
+            )
+            node.excluded_target = (
+                node.name in excluded_target or node.id in excluded_target
+            )
+
+    def _use_vectorized_analysis(self, nodes: List[NodeInfo]) -> bool:
+        """Whether the NumPy fast path should handle this node list
+
+        The scalar loops emit per-node debug diagnostics, so the fast path is
+        only taken when debug logging is off and the cluster is large enough
+        for vectorization to pay off.
+        """
+        return (
+            np is not None
+            and len(nodes) >= _VECTORIZE_MIN_NODES
+            and not logging.getLogger().isEnabledFor(logging.DEBUG)
+        )
+
+    def _find_overloaded_nodes_vectorized(
+        self, nodes: List[NodeInfo]
+    ) -> List[NodeInfo]:
+        """NumPy SoA fast path mirroring find_overloaded_nodes"""
+        eligible = [
+            node
+            for node in nodes
+            if not node.is_maintenance and not node.excluded_source
+        ]
+        if not eligible:
+            return []
+
+        count = len(eligible)
+        cpu = np.fromiter(
+            (node.effective_cpu_load for node in eligible),
+            dtype=np.float64,
+            count=count,
+        )
+        mem = np.fromiter(
+            (node.memory_usage_percent for node in eligible),
+            dtype=np.float64,
+            count=count,
+        )
+        mask = (cpu > self.cpu_overload_threshold) | (
+            mem > self.memory_overload_threshold
+        )
+
+        overloaded = [eligible[i] for i in np.nonzero(mask)[0]]
+        for node in overloaded:
+            logging.info(
+                t(
+                    "node_overloaded",
+                    node_name=node.name,
+                    cpu_load=node.effective_cpu_load,
+                    memory_usage=node.memory_usage_percent,
+                )
+            )
+        overloaded.sort(key=attrgetter("combined_load_score"), reverse=True)
+        return overloaded
+
+    def _find_underloaded_nodes_vectorized(
+        self, nodes: List[NodeInfo]
+    ) -> List[NodeInfo]:
+        """NumPy SoA fast path mirroring find_underloaded_nodes"""
+        eligible = [
+            node for node in nodes if node.can_accept_vms and not node.excluded_target
+        ]
+        if not eligible:
+            return []
+
+        count = len(eligible)
+        cpu = np.fromiter(
+            (node.effective_cpu_load for node in eligible),
+            dtype=np.float64,
+            count=count,
+        )
+        mem = np.fromiter(
+            (node.memory_usage_percent for node in eligible),
+            dtype=np.float64,
+            count=count,
+        )
+        mask = (cpu < self.cpu_target_threshold) & (mem < self.memory_target_threshold)
+
+        underloaded = [eligible[i] for i in np.nonzero(mask)[0]]
+        underloaded.sort(key=attrgetter("cpu_load_score", "memory_usage_percent"))
+        return underloaded
+
     def find_overloaded_nodes(self, nodes: List[NodeInfo]) -> List[NodeInfo]:
         """Find nodes that are overloaded"""
+        if self._use_vectorized_analysis(nodes):
+            return self._find_overloaded_nodes_vectorized(nodes)
+
         overloaded = []
+        # Hoist attribute lookups out of the per-node loop
+        cpu_threshold = self.cpu_overload_threshold
+        memory_threshold = self.memory_overload_threshold
         for node in nodes:
             # Skip excluded source nodes
-            if (
-                node.name in self.excluded_source_nodes
-                or node.id in self.excluded_source_nodes
-            ):
-                logging.debug(f"Node {node.name} excluded from migration sources")
+            if node.excluded_source:
+                logging.debug("Node %s excluded from migration sources", node.name)
                 continue
 
             # Use effective CPU load instead of just load score
-            cpu_overloaded = node.effective_cpu_load > self.cpu_overload_threshold
-            memory_overloaded = (
-                node.memory_usage_percent > self.memory_overload_threshold
-            )
+            cpu_overloaded = node.effective_cpu_load > cpu_threshold
+            memory_overloaded = node.memory_usage_percent > memory_threshold
 
             if not node.is_maintenance and (cpu_overloaded or memory_overloaded):
                 logging.info(
@@ -143,48 +343,55 @@ class VMBalancer:
                 )
                 overloaded.append(node)
 
-        # Sort by combined load score (most loaded first)
-        overloaded.sort(
-            key=lambda n: n.cpu_load_score + (n.memory_usage_percent / 100),
-            reverse=True,
-        )
+        # Sort by combined load score (most loaded first); attrgetter avoids
+        # re-running a Python lambda for every comparison key
+        overloaded.sort(key=attrgetter("combined_load_score"), reverse=True)
         return overloaded
 
     def find_underloaded_nodes(self, nodes: List[NodeInfo]) -> List[NodeInfo]:
         """Find nodes that have capacity for more VMs"""
+        if self._use_vectorized_analysis(nodes):
+            return self._find_underloaded_nodes_vectorized(nodes)
+
         underloaded = []
+        # Hoist attribute lookups out of the per-node loop
+        cpu_threshold = self.cpu_target_threshold
+        memory_threshold = self.memory_target_threshold
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         for node in nodes:
             # Skip excluded target nodes
-            if (
-                node.name in self.excluded_target_nodes
-                or node.id in self.excluded_target_nodes
-            ):
-                logging.debug(f"Node {node.name} excluded from migration targets")
+            if node.excluded_target:
+                logging.debug("Node %s excluded from migration targets", node.name)
                 continue
 
-            qemu_info = (
-                f", QEMU={node.qemu_version}" if node.qemu_version else ", QEMU=unknown"
-            )
-            logging.debug(
-                f"Checking node {node.name}: maintenance={node.is_maintenance},"
-                f" vm_creation_allowed={node.vm_creation_allowed},"
-                f" vm_count={node.vm_count}, vm_limit={node.vm_limit},"
-                f" can_accept_vms={node.can_accept_vms},"
-                f" CPU_ratio={node.cpu_allocation_ratio:.1f}:1"
-                f" ({node.cpu_used}/{node.cpu_total}),"
-                f" Memory={node.memory_usage_percent:.1f}%{qemu_info}"
-            )
+            # This per-node summary is by far the most expensive log format in
+            # the loop; only build it when debug output is actually emitted
+            if debug_enabled:
+                qemu_info = (
+                    f", QEMU={node.qemu_version}"
+                    if node.qemu_version
+                    else ", QEMU=unknown"
+                )
+                logging.debug(
+                    f"Checking node {node.name}: maintenance={node.is_maintenance},"
+                    f" vm_creation_allowed={node.vm_creation_allowed},"
+                    f" vm_count={node.vm_count}, vm_limit={node.vm_limit},"
+                    f" can_accept_vms={node.can_accept_vms},"
+                    f" CPU_ratio={node.cpu_allocation_ratio:.1f}:1"
+                    f" ({node.cpu_used}/{node.cpu_total}),"
+                    f" Memory={node.memory_usage_percent:.1f}%{qemu_info}"
+                )
 
             # Check if node can accept VMs and has capacity (use effective CPU load)
-            cpu_has_capacity = node.effective_cpu_load < self.cpu_target_threshold
-            memory_has_capacity = (
-                node.memory_usage_percent < self.memory_target_threshold
-            )
+            cpu_has_capacity = node.effective_cpu_load < cpu_threshold
+            memory_has_capacity = node.memory_usage_percent < memory_threshold
 
             if node.can_accept_vms and cpu_has_capacity and memory_has_capacity:
                 logging.debug(t("node_target_found", node_name=node.name))
                 underloaded.append(node)
-            else:
+            elif debug_enabled:
+                # Rejection reasons exist purely for the debug log; do not
+                # build the string list at all when debug output is off
                 reasons = []
                 if not node.can_accept_vms:
                     if node.is_maintenance:
@@ -208,33 +415,56 @@ class VMBalancer:
                 if not reasons:  # If no specific reasons found, add generic message
                     reasons.append("unknown reason")
 
-                logging.debug(f"Node {node.name} rejected: {', '.join(reasons)}")
+                logging.debug("Node %s rejected: %s", node.name, ", ".join(reasons))
 
         # Sort by available capacity (lowest load score first, then memory)
-        underloaded.sort(key=lambda n: (n.cpu_load_score, n.memory_usage_percent))
+        underloaded.sort(key=attrgetter("cpu_load_score", "memory_usage_percent"))
         return underloaded
 
     def select_vm_for_migration(
-        self, vms: List[VMInfo], source_node: NodeInfo
+        self, vms_by_node: Dict[str, List[VMInfo]], source_node: NodeInfo
     ) -> Optional[VMInfo]:
         """Select best VM candidate for migration from overloaded node"""
-        # Filter VMs that can be migrated and are on source node
-        all_vms_on_node = [vm for vm in vms if vm.node_id == source_node.id]
-        candidates = [vm for vm in all_vms_on_node if vm.can_migrate]
+        all_vms_on_node = vms_by_node.get(source_node.id, [])
+
+        # Single fused pass over the node's VMs: apply the migratable,
+        # recently-migrated and blacklist filters without building the
+        # intermediate candidate lists
+        recently_migrated_ids = self._recently_migrated_ids
+        blacklisted_ids = self._blacklisted_ids
+        memory_cap_mb = self.max_vm_memory_to_migrate_mb
+        migratable_count = 0
+        recent_count = 0
+        blacklisted_count = 0
+        too_heavy_count = 0
+        final_candidates = []
+        for vm in all_vms_on_node:
+            if not vm.can_migrate:
+                continue
+            migratable_count += 1
+            if vm.id in recently_migrated_ids:
+                recent_count += 1
+            elif vm.id in blacklisted_ids:
+                blacklisted_count += 1
+            elif memory_cap_mb > 0 and vm.memory_mb > memory_cap_mb:
+                # Heavy VMs move slowly (live migration is bound by memory
+                # copy) and degrade the guest while doing so; skip them
+                too_heavy_count += 1
+            else:
+                final_candidates.append(vm)
 
         logging.debug(
-            f"Node {source_node.name}: {len(all_vms_on_node)} total VMs,"
-            f" {len(candidates)} can migrate"
+            "Node %s: %d total VMs, %d can migrate",
+            source_node.name,
+            len(all_vms_on_node),
+            migratable_count,
         )
 
-        if not candidates:
+        if not migratable_count:
             if all_vms_on_node:
-                non_migratable_states = {}
-                for vm in all_vms_on_node:
-                    if not vm.can_migrate:
-                        non_migratable_states[vm.state] = (
-                            non_migratable_states.get(vm.state, 0) + 1
-                        )
+                non_migratable_states = Counter(
+                    vm.state for vm in all_vms_on_node if not vm.can_migrate
+                )
                 logging.info(
                     f"Node {source_node.name}: {len(all_vms_on_node)} VMs present, but"
                     f" none can migrate. VM states: {dict(non_migratable_states)}"
@@ -243,68 +473,76 @@ class VMBalancer:
                 logging.info(f"Node {source_node.name}: No VMs found on this node")
             return None
 
-        # Exclude VMs that were recently migrated
-        recent_cutoff = datetime.now() - timedelta(hours=1)
-        recent_candidates = [
-            vm
-            for vm in candidates
-            if self.migration_history.get(vm.id, datetime.min) < recent_cutoff
-        ]
-
-        if not recent_candidates:
-            logging.info(
-                f"Node {source_node.name}: {len(candidates)} VMs can migrate, "
-                "but all were recently migrated (within 1 hour)"
-            )
-            return None
-
-        # Exclude VMs that are in blacklist (failed migrations within last 24 hours)
-        blacklist_cutoff = datetime.now() - timedelta(hours=24)
-        final_candidates = [
-            vm
-            for vm in recent_candidates
-            if self.migration_blacklist.get(vm.id, datetime.min) < blacklist_cutoff
-        ]
-
         if not final_candidates:
-            blacklisted_count = len(recent_candidates) - len(final_candidates)
-            logging.info(
-                f"Node {source_node.name}: {len(recent_candidates)} VMs can migrate, "
-                f"but {blacklisted_count} are blacklisted due to recent failures"
-            )
+            if migratable_count == recent_count:
+                logging.info(
+                    f"Node {source_node.name}: {migratable_count} VMs can migrate, "
+                    "but all were recently migrated (within 1 hour)"
+                )
+            elif too_heavy_count and recent_count + blacklisted_count == 0:
+                logging.info(
+                    f"Node {source_node.name}: {migratable_count} VMs can migrate,"
+                    f" but all exceed the {memory_cap_mb}MB migration size cap"
+                )
+            else:
+                logging.info(
+                    f"Node {source_node.name}:"
+                    f" {migratable_count - recent_count} VMs can migrate, "
+                    f"but {blacklisted_count} are blacklisted due to recent failures"
+                )
             return None
 
-        # Sort by resource usage (migrate smaller VMs first for easier balancing)
-        final_candidates.sort(key=lambda vm: vm.cpu_cores + (vm.memory_mb / 1024))
-
-        selected_vm = final_candidates[0]
+        # Pick the smallest VM by resource usage (easier balancing); min() is
+        # a single O(n) pass, no need to sort the whole candidate list
+        selected_vm = min(final_candidates, key=attrgetter("migration_size_score"))
         logging.debug(
-            f"Node {source_node.name}: Selected VM {selected_vm.name} for migration "
-            f"(CPU: {selected_vm.cpu_cores}, Memory: {selected_vm.memory_mb}MB)"
+            "Node %s: Selected VM %s for migration (CPU: %s, Memory: %sMB)",
+            source_node.name,
+            selected_vm.name,
+            selected_vm.cpu_cores,
+            selected_vm.memory_mb,
         )
 
         return selected_vm
 
     def can_node_accept_vm(self, node: NodeInfo, vm: VMInfo) -> bool:
         """Check if node can accept the VM without becoming overloaded"""
+        # Nodes with missing capacity data cannot be estimated - reject them
+        if node.cpu_total <= 0 or node.memory_total_mb <= 0:
+            return False
+
         # Estimate resource usage after migration
         estimated_cpu_ratio = (node.cpu_used + vm.cpu_cores) / node.cpu_total
         estimated_memory = node.memory_usage_percent + (
             vm.memory_mb / node.memory_total_mb * 100
         )
 
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
         cpu_ok = (
             estimated_cpu_ratio < self.cpu_overload_threshold
         )  # Use overload threshold for final check
         memory_ok = estimated_memory < self.memory_overload_threshold
 
+        # "Does not fit" is the common case; bail out before the QEMU version
+        # work unless debug diagnostics were asked for
+        if not (cpu_ok and memory_ok) and not debug_enabled:
+            return False
+
         # Check QEMU version compatibility
         qemu_ok = True
         source_node = self.get_source_node_for_vm(vm)
         if source_node and node.qemu_version and source_node.qemu_version:
-            qemu_ok = self.api.compare_qemu_versions(
-                source_node.qemu_version, node.qemu_version
-            )
+            # Compare the packed version keys memoized on the nodes; each
+            # version string is parsed once per node and the check is a
+            # single int comparison per (vm, node) pair. The keys are only
+            # None when the version string is empty, which the guard above
+            # excludes, but spell that out so the comparison is on plain ints
+            # (a missing key stays compatible, as before)
+            target_key = node.qemu_version_key
+            source_key = source_node.qemu_version_key
+            if target_key is not None and source_key is not None:
+                qemu_ok = target_key >= source_key
             if not qemu_ok:
                 logging.warning(
                     f"QEMU version incompatible for VM {vm.name}: source node"
@@ -320,43 +558,91 @@ class VMBalancer:
                     f" target ({node.name}) nodes"
                 )
             elif not node.qemu_version:
-                logging.debug(f"QEMU version unknown for target node {node.name}")
+                logging.debug("QEMU version unknown for target node %s", node.name)
             elif not source_node.qemu_version:
                 logging.debug(
                     f"QEMU version unknown for source node {source_node.name}"
                 )
 
-        logging.debug(
-            f"Can {node.name} accept VM {vm.name}? Current: CPU"
-            f" {node.cpu_allocation_ratio:.1f}:1, Memory"
-            f" {node.memory_usage_percent:.1f}% | After: CPU"
-            f" {estimated_cpu_ratio:.1f}:1, Memory {estimated_memory:.1f}% |"
-            f" CPU_ok={cpu_ok}, Memory_ok={memory_ok}, QEMU_ok={qemu_ok}"
-        )
+        # Skip the expensive f-string entirely unless debug output is wanted
+        if debug_enabled:
+            logging.debug(
+                f"Can {node.name} accept VM {vm.name}? Current: CPU"
+                f" {node.cpu_allocation_ratio:.1f}:1, Memory"
+                f" {node.memory_usage_percent:.1f}% | After: CPU"
+                f" {estimated_cpu_ratio:.1f}:1, Memory {estimated_memory:.1f}% |"
+                f" CPU_ok={cpu_ok}, Memory_ok={memory_ok}, QEMU_ok={qemu_ok}"
+            )
 
         return cpu_ok and memory_ok and qemu_ok
 
     def get_source_node_for_vm(self, vm: VMInfo) -> Optional[NodeInfo]:
-        """Find source node for given VM"""
-        # This method needs access to current cluster nodes
-        # We'll need to pass this information differently
-        if hasattr(self, "_current_cluster_nodes"):
-            for node in self._current_cluster_nodes:
-                if node.id == vm.node_id:
-                    return node
-        return None
+        """Find source node for given VM
+
+        O(1) lookup in the id index that prepare_nodes rebuilds for each
+        cluster, instead of scanning the node list per (VM, target) check.
+        The index lives in thread-local storage so concurrently balanced
+        clusters do not clobber each other's context.
+        """
+        node_by_id = getattr(self._cluster_context, "node_by_id", None)
+        if not node_by_id:
+            return None
+        return node_by_id.get(vm.node_id)
 
     def find_target_node(
         self, vm: VMInfo, underloaded_nodes: List[NodeInfo]
     ) -> Optional[NodeInfo]:
-        """Find suitable target node for VM migration"""
+        """Find the best-fit target node for VM migration
+
+        Best-fit placement: among candidates that can take the VM, pick the
+        one left with the least normalized headroom below the overload
+        thresholds. Packing tightly keeps the remaining nodes empty enough
+        to absorb later (and larger) VMs, so the cluster converges in fewer
+        migration cycles than the previous first-fit scan over the
+        least-loaded-first ordering.
+        """
+        cpu_threshold = self.cpu_overload_threshold
+        memory_threshold = self.memory_overload_threshold
+        vm_cpu = vm.cpu_cores
+        vm_memory = vm.memory_mb
+        best_node: Optional[NodeInfo] = None
+        best_headroom: Optional[float] = None
         for node in underloaded_nodes:
-            if self.can_node_accept_vm(node, vm):
-                return node
-        return None
+            # Cheap capacity screen first: nodes that obviously cannot fit the
+            # VM are rejected without the QEMU checks and debug formatting
+            # that can_node_accept_vm performs
+            if node.cpu_total <= 0 or node.memory_total_mb <= 0:
+                continue  # can_node_accept_vm rejects these anyway
+            estimated_cpu_ratio = (node.cpu_used + vm_cpu) / node.cpu_total
+            if estimated_cpu_ratio >= cpu_threshold:
+                continue
+            estimated_memory = (
+                (node.memory_used_mb + vm_memory) / node.memory_total_mb * 100
+            )
+            if estimated_memory >= memory_threshold:
+                continue
 
-    def balance_cluster(self, cluster: ClusterInfo) -> int:
-        """Balance VMs in cluster, returns number of migrations performed"""
+            # Fraction of threshold left after placement; smaller = tighter fit
+            headroom = min(
+                (cpu_threshold - estimated_cpu_ratio) / cpu_threshold,
+                (memory_threshold - estimated_memory) / memory_threshold,
+            )
+            if best_headroom is not None and headroom >= best_headroom:
+                continue
+            if self.can_node_accept_vm(node, vm):
+                best_node = node
+                best_headroom = headroom
+        return best_node
+
+    def balance_cluster(
+        self, cluster: ClusterInfo, vms: Optional[List[VMInfo]] = None
+    ) -> int:
+        """Balance VMs in cluster, returns number of migrations performed
+
+        When the caller already holds this cluster's VM list (from a single
+        per-cycle fetch), it is passed in via ``vms`` to avoid re-downloading
+        the global VM payload for every cluster.
+        """
         logging.info(f"Starting balance check for cluster: {cluster.name}")
 
         # Update load averages via SSH if enabled
@@ -368,39 +654,38 @@ class VMBalancer:
             except Exception as e:
                 logging.warning(f"SSH monitoring failed: {e}, falling back to API data")
 
-        # Store current cluster nodes for QEMU version checking
-        self._current_cluster_nodes = cluster.nodes
+        # Resolve exclusion flags and the node-id index for this cluster
+        self.prepare_nodes(cluster.nodes)
 
-        # Log threshold settings
+        # Log threshold settings (%-style so formatting is deferred unless
+        # DEBUG is actually enabled)
         logging.debug(
-            f"Thresholds - CPU overload: {self.cpu_overload_threshold} (load score), "
-            f"Memory overload: {self.memory_overload_threshold}%, "
-            f"CPU target: {self.cpu_target_threshold} (load score), "
-            f"Memory target: {self.memory_target_threshold}%"
+            "Thresholds - CPU overload: %s (load score), Memory overload: %s%%,"
+            " CPU target: %s (load score), Memory target: %s%%",
+            self.cpu_overload_threshold,
+            self.memory_overload_threshold,
+            self.cpu_target_threshold,
+            self.memory_target_threshold,
         )
 
         # Log migration settings
         logging.debug(
-            "Migration settings - Max migrations per cycle:"
-            f" {self.max_migrations_per_cycle}, Blacklist retention: 24 hours"
+            "Migration settings - Max migrations per cycle: %s,"
+            " Blacklist retention: 24 hours",
+            self.max_migrations_per_cycle,
         )
 
         # Log excluded nodes
         if self.excluded_source_nodes:
-            logging.info(
-                f"Excluded migration sources: {', '.join(self.excluded_source_nodes)}"
-            )
+            logging.info(f"Excluded migration sources: {self._excluded_source_str}")
         if self.excluded_target_nodes:
-            logging.info(
-                f"Excluded migration targets: {', '.join(self.excluded_target_nodes)}"
-            )
+            logging.info(f"Excluded migration targets: {self._excluded_target_str}")
 
         # Log nodes with restrictions
-        restricted_nodes = [
-            node for node in cluster.nodes if not node.vm_creation_allowed
+        restricted_names = [
+            node.name for node in cluster.nodes if not node.vm_creation_allowed
         ]
-        if restricted_nodes:
-            restricted_names = [node.name for node in restricted_nodes]
+        if restricted_names:
             logging.info(
                 f"Nodes with VM creation disabled: {', '.join(restricted_names)}"
             )
@@ -417,118 +702,125 @@ class VMBalancer:
             logging.warning(f"No available target nodes in cluster {cluster.name}")
             return 0
 
-        # Get VMs in cluster
-        cluster_vms = self.api.get_cluster_vms(cluster.id)
-        migrations_performed = 0
+        # Get VMs in cluster, partitioned by node in a single pass
+        cluster_vms = vms if vms is not None else self.api.get_cluster_vms(cluster.id)
+        vms_by_node = group_vms_by_node(cluster_vms)
 
-        # Try to migrate VMs up to the configured limit per iteration
-        for source_node in overloaded_nodes:
-            if (
-                migrations_performed >= self.max_migrations_per_cycle
-            ):  # Limit to max_migrations_per_cycle
-                break
+        # Plan against virtual state first, then act: planning never touches
+        # the live NodeInfo objects, so a simulated placement can not leak
+        # into the data real decisions are made from
+        plans = self.plan_migrations(overloaded_nodes, underloaded_nodes, vms_by_node)
 
-            logging.info(
-                f"Node {source_node.name} is overloaded: CPU allocation"
-                f" {source_node.cpu_allocation_ratio:.1f}:1"
-                f" ({source_node.cpu_used}/{source_node.cpu_total}), CPU load score"
-                f" {source_node.cpu_load_score:.1f}, Memory"
-                f" {source_node.memory_usage_percent:.1f}%"
-            )
+        # Each migrate_vm call blocks for up to migration_timeout, so batches
+        # run concurrently; plans never share a source node and target
+        # capacity was already reserved during planning
+        migrations_performed = 0
+        workers = min(self.migration_parallelism, len(plans))
+        if workers <= 1:
+            for vm_to_migrate, source_node, target_node in plans:
+                if self._execute_migration(vm_to_migrate, source_node, target_node):
+                    migrations_performed += 1
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._execute_migration, *plan) for plan in plans
+                ]
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            migrations_performed += 1
+                    except Exception as e:
+                        logging.error(f"Migration worker failed: {e}")
 
-            # Select VM to migrate
-            vm_to_migrate = self.select_vm_for_migration(cluster_vms, source_node)
-            if not vm_to_migrate:
-                logging.info(
-                    f"No suitable VM found for migration from {source_node.name}"
-                )
-                continue
+        return migrations_performed
 
-            # Find target node
-            target_node = self.find_target_node(vm_to_migrate, underloaded_nodes)
-            if not target_node:
-                logging.info(
-                    f"No suitable target node found for VM {vm_to_migrate.name}"
-                )
-                continue
+    def _execute_migration(
+        self, vm_to_migrate: VMInfo, source_node: NodeInfo, target_node: NodeInfo
+    ) -> bool:
+        """Execute (or, in dry-run mode, simulate) one planned migration
 
-            # Perform migration
-            logging.info(
-                f"{'[DRY RUN] Would migrate' if self.dry_run else 'Migrating'} VM"
-                f" {vm_to_migrate.name} from {source_node.name} to {target_node.name}"
-            )
+        This is the act half of the plan/act split: only here, after the API
+        confirmed success (or the dry run stood in for it), are the live
+        NodeInfo counters updated.
+        """
+        logging.info(
+            f"{'[DRY RUN] Would migrate' if self.dry_run else 'Migrating'} VM"
+            f" {vm_to_migrate.name} from {source_node.name} to {target_node.name}"
+        )
 
-            # Notify migration start
+        # Notify migration start
+        if self.telegram_notifier:
             self.telegram_notifier.notify_migration_start(
                 vm_to_migrate.name, source_node.name, target_node.name
             )
 
-            if self.dry_run:
-                # In dry run mode, just log what would be done
-                logging.info(
-                    f"[DRY RUN] VM {vm_to_migrate.name} migration simulated"
-                    " successfully"
-                )
+        if self.dry_run:
+            # In dry run mode, just log what would be done
+            logging.info(
+                f"[DRY RUN] VM {vm_to_migrate.name} migration simulated successfully"
+            )
+            if self.telegram_notifier:
                 self.telegram_notifier.notify_migration_success(
                     vm_to_migrate.name, source_node.name, target_node.name, 0
                 )
-                migrations_performed += 1
 
-                # Update node info for simulation
+            # Update node info for simulation
+            with self._history_lock:
                 source_node.vm_count -= 1
                 target_node.vm_count += 1
-            else:
-                # Real migration - track start time for duration calculation
-                migration_start_time = time.time()
-
-                if self.api.migrate_vm(
-                    vm_to_migrate.id, target_node.id, self.migration_timeout
-                ):
-                    migration_duration = time.time() - migration_start_time
-                    logging.info(f"Successfully migrated VM {vm_to_migrate.name}")
-                    self.migration_history[vm_to_migrate.id] = datetime.now()
-                    migrations_performed += 1
+            return True
 
-                    # Notify successful migration
-                    self.telegram_notifier.notify_migration_success(
-                        vm_to_migrate.name,
-                        source_node.name,
-                        target_node.name,
-                        migration_duration,
-                    )
+        # Real migration - track start time for duration calculation
+        migration_start_time = time.time()
 
-                    # Update node info after migration
-                    source_node.vm_count -= 1
-                    target_node.vm_count += 1
-
-                    # Remove target node from underloaded list if it's getting full
-                    if not self.can_node_accept_vm(target_node, vm_to_migrate):
-                        underloaded_nodes.remove(target_node)
-                else:
-                    logging.error(f"Failed to migrate VM {vm_to_migrate.name}")
-                    # Add to blacklist to prevent retry attempts for 24 hours
-                    self.migration_blacklist[vm_to_migrate.id] = datetime.now()
-                    logging.debug(
-                        f"VM {vm_to_migrate.name} added to migration blacklist"
-                    )
+        if self.api.migrate_vm(
+            vm_to_migrate.id, target_node.id, self.migration_timeout
+        ):
+            migration_duration = time.time() - migration_start_time
+            logging.info(f"Successfully migrated VM {vm_to_migrate.name}")
+            with self._history_lock:
+                self.migration_history[vm_to_migrate.id] = time.monotonic()
+                self._recently_migrated_ids.add(vm_to_migrate.id)
+            self._state_cache.invalidate()
 
-                    # Notify failed migration
-                    self.telegram_notifier.notify_migration_failure(
-                        vm_to_migrate.name,
-                        source_node.name,
-                        target_node.name,
-                        "Migration failed",
-                    )
+            # Notify successful migration
+            if self.telegram_notifier:
+                self.telegram_notifier.notify_migration_success(
+                    vm_to_migrate.name,
+                    source_node.name,
+                    target_node.name,
+                    migration_duration,
+                )
 
-        # Clean up cluster nodes reference
-        self._current_cluster_nodes = None
+            # Update node info after migration (under the lock: concurrent
+            # plans may share a target node)
+            with self._history_lock:
+                source_node.vm_count -= 1
+                target_node.vm_count += 1
+            return True
 
-        return migrations_performed
+        logging.error(f"Failed to migrate VM {vm_to_migrate.name}")
+        # Add to blacklist to prevent retry attempts for 24 hours
+        with self._history_lock:
+            self.migration_blacklist[vm_to_migrate.id] = time.monotonic()
+            self._blacklisted_ids.add(vm_to_migrate.id)
+        logging.debug(f"VM {vm_to_migrate.name} added to migration blacklist")
+
+        # Notify failed migration
+        if self.telegram_notifier:
+            self.telegram_notifier.notify_migration_failure(
+                vm_to_migrate.name,
+                source_node.name,
+                target_node.name,
+                "Migration failed",
+            )
+        return False
 
     def run_balance_cycle(self) -> None:
         """Run one complete balance cycle for all clusters"""
         mode_text = "[DRY RUN] " if self.dry_run else ""
         logging.info(f"{mode_text}Starting balance cycle")
+        self.begin_cycle()
 
         # Authenticate with VMManager first
         if not self.api.authenticate():
@@ -540,8 +832,8 @@ class VMBalancer:
             logging.error("VMManager API is not accessible")
             return
 
-        # Get all clusters
-        all_clusters = self.api.get_clusters()
+        # Get all clusters (cached between closely spaced cycles)
+        all_clusters = self._state_cache.get_or_fetch("clusters", self.api.get_clusters)
         if not all_clusters:
             logging.warning("No clusters found")
             return
@@ -563,13 +855,40 @@ class VMBalancer:
         # Notify balance cycle start
         self.telegram_notifier.notify_balance_cycle_start(len(clusters), self.dry_run)
 
+        # One global VM fetch for the whole cycle instead of one per cluster
+        vms_by_cluster = self._state_cache.get_or_fetch(
+            "vms", self.api.get_vms_by_cluster
+        )
+
         total_migrations = 0
-        for cluster in clusters:
-            try:
-                migrations = self.balance_cluster(cluster)
-                total_migrations += migrations
-            except Exception as e:
-                logging.error(f"Error balancing cluster {cluster.name}: {e}")
+        max_workers = min(self.max_parallel_clusters, len(clusters))
+        if max_workers <= 1:
+            for cluster in clusters:
+                try:
+                    total_migrations += self.balance_cluster(
+                        cluster, vms_by_cluster.get(cluster.id, [])
+                    )
+                except Exception as e:
+                    logging.error(f"Error balancing cluster {cluster.name}: {e}")
+        else:
+            # Clusters are independent and the work is dominated by HTTP
+            # round-trips (the GIL is released during I/O), so balance them
+            # concurrently and reap results as they finish
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.balance_cluster,
+                        cluster,
+                        vms_by_cluster.get(cluster.id, []),
+                    ): cluster
+                    for cluster in clusters
+                }
+                for future in as_completed(futures):
+                    cluster = futures[future]
+                    try:
+                        total_migrations += future.result()
+                    except Exception as e:
+                        logging.error(f"Error balancing cluster {cluster.name}: {e}")
 
         logging.info(
             f"{mode_text}Balance cycle completed. Total migrations: {total_migrations}"
@@ -665,32 +984,48 @@ class VMBalancer:
                 "SSH monitoring failed for all nodes, falling back to API data"
             )
 
-    async def run_once(self) -> None:
-        """Run one balancing cycle"""
+    async def run_once(self) -> int:
+        """Run one balancing cycle, returns the number of migrations performed"""
         try:
             logging.info(t("balancer_starting"))
+            self.begin_cycle()
+
+            # Bounds concurrent migrations in this cycle's batch (same
+            # MIGRATION_PARALLELISM knob as the sync executor path); created
+            # here so the semaphore is bound to the running event loop
+            limit = max(1, self.migration_parallelism)
+            self._migration_semaphore = asyncio.Semaphore(limit)
 
             # Authenticate with VMManager first
-            if not self.api.authenticate():
+            if not await self._call_api(self.api.authenticate):
                 logging.error("Failed to authenticate with VMManager API")
-                return
+                return 0
 
-            # Get all clusters
-            clusters = self.api.get_clusters()
+            # Get all clusters (cached between closely spaced cycles)
+            clusters = await self._call_api(
+                self._state_cache.get_or_fetch, "clusters", self.api.get_clusters
+            )
             filtered_clusters = self.filter_clusters(clusters)
 
             if not filtered_clusters:
                 logging.warning(t("balancer_no_clusters"))
-                return
+                return 0
 
             logging.info(t("balancer_cycle_start", count=len(filtered_clusters)))
 
+            total_migrations = 0
+
+            # One global VM fetch per cycle; get_clusters already populated
+            # cluster.nodes from a single node fetch
+            vms_by_cluster = await self._call_api(
+                self._state_cache.get_or_fetch, "vms", self.api.get_vms_by_cluster
+            )
+
             for cluster in filtered_clusters:
                 logging.info(f"Processing cluster: {cluster.name} (ID: {cluster.id})")
 
-                # Get cluster nodes and VMs
-                nodes = self.api.get_cluster_nodes(cluster.id)
-                vms = self.api.get_cluster_vms(cluster.id)
+                nodes = cluster.nodes
+                vms = vms_by_cluster.get(cluster.id, [])
 
                 if not nodes:
                     logging.warning(f"No nodes found in cluster {cluster.name}")
@@ -700,12 +1035,18 @@ class VMBalancer:
                     logging.info(f"No VMs found in cluster {cluster.name}")
                     continue
 
+                # Resolve exclusion flags once for this cluster's nodes
+                self.prepare_nodes(nodes)
+
                 # Setup SSH monitoring for nodes if enabled
                 self.setup_ssh_monitoring(nodes)
 
                 # Update nodes with load average via SSH
                 await self.update_nodes_load_average(nodes)
 
+                # Partition VMs by node once for this cluster
+                vms_by_node = group_vms_by_node(vms)
+
                 # Check if balancing is needed
                 overloaded_nodes = self.find_overloaded_nodes(nodes)
 
@@ -718,50 +1059,25 @@ class VMBalancer:
                     " node(s)"
                 )
 
-                # Process migrations for this cluster
-                migrations_performed = 0
-
-                for source_node in overloaded_nodes:
-                    if migrations_performed >= self.max_migrations_per_cycle:
-                        logging.info(
-                            "Maximum migrations per cycle reached"
-                            f" ({self.max_migrations_per_cycle})"
-                        )
-                        break
-
-                    # Get VMs on this node
-                    node_vms = [vm for vm in vms if vm.node_id == source_node.id]
-
-                    if not node_vms:
-                        logging.debug(
-                            f"No VMs found on overloaded node {source_node.name}"
-                        )
-                        continue
-
-                    # Select VM to migrate
-                    vm_to_migrate = self.select_vm_for_migration(node_vms, source_node)
+                # Plan migrations over disjoint node pairs, then run the
+                # plans concurrently under the semaphore
+                plans = self.plan_migrations(
+                    overloaded_nodes,
+                    self.find_underloaded_nodes(nodes),
+                    vms_by_node,
+                )
 
-                    if not vm_to_migrate:
-                        logging.debug(
-                            "No suitable VM found for migration from node"
-                            f" {source_node.name}"
+                migrations_performed = 0
+                if plans:
+                    results = await asyncio.gather(
+                        *(
+                            self._migrate_with_limit(vm, source, target)
+                            for vm, source, target in plans
                         )
-                        continue
-
-                    # Find target node
-                    underloaded_nodes = self.find_underloaded_nodes(nodes)
-                    target_node = self.find_target_node(
-                        vm_to_migrate, underloaded_nodes
                     )
+                    migrations_performed = sum(1 for ok in results if ok)
 
-                    if not target_node:
-                        logging.warning(t("node_no_target", vm_name=vm_to_migrate.name))
-                        continue
-
-                    # Perform migration
-                    if await self.migrate_vm(vm_to_migrate, source_node, target_node):
-                        migrations_performed += 1
-
+                total_migrations += migrations_performed
                 logging.info(
                     f"Cluster {cluster.name}: Completed"
                     f" {migrations_performed} migration(s)"
@@ -774,6 +1090,7 @@ class VMBalancer:
                 )
 
             logging.info(t("balancer_cycle_complete"))
+            return total_migrations
 
         except Exception as e:
             logging.error(t("error_cluster_load", cluster_id="cycle", error=str(e)))
@@ -781,6 +1098,107 @@ class VMBalancer:
                 await self.telegram_notifier.send_error_notification(str(e))
             raise
 
+    def plan_migrations(
+        self,
+        overloaded_nodes: List[NodeInfo],
+        underloaded_nodes: List[NodeInfo],
+        vms_by_node: Dict[str, List[VMInfo]],
+    ) -> List[Tuple[VMInfo, NodeInfo, NodeInfo]]:
+        """Plan up to max_migrations_per_cycle (vm, source, target) migrations
+
+        Each source node contributes at most one plan, so concurrent plans
+        never fight over a source. Targets may repeat: capacity already
+        claimed by an earlier plan is reserved virtually on shadow copies of
+        the candidate nodes, so later plans are placed against the state the
+        cluster will have once the batch lands, without mutating the real
+        NodeInfo objects before any migration has actually succeeded.
+        """
+        plans: List[Tuple[VMInfo, NodeInfo, NodeInfo]] = []
+
+        # Shadow targets carry the virtual usage of plans made this cycle
+        shadow_targets = [replace(node) for node in underloaded_nodes]
+        real_target_by_id = {node.id: node for node in underloaded_nodes}
+
+        for source_node in overloaded_nodes:
+            if len(plans) >= self.max_migrations_per_cycle:
+                logging.info(
+                    "Maximum migrations per cycle reached"
+                    f" ({self.max_migrations_per_cycle})"
+                )
+                break
+
+            logging.info(
+                f"Node {source_node.name} is overloaded: CPU allocation"
+                f" {source_node.cpu_allocation_ratio:.1f}:1"
+                f" ({source_node.cpu_used}/{source_node.cpu_total}), CPU load score"
+                f" {source_node.cpu_load_score:.1f}, Memory"
+                f" {source_node.memory_usage_percent:.1f}%"
+            )
+
+            # Get VMs on this node
+            if not vms_by_node.get(source_node.id):
+                logging.debug(f"No VMs found on overloaded node {source_node.name}")
+                continue
+
+            # Select VM to migrate
+            vm_to_migrate = self.select_vm_for_migration(vms_by_node, source_node)
+            if not vm_to_migrate:
+                logging.debug(
+                    f"No suitable VM found for migration from node {source_node.name}"
+                )
+                continue
+
+            # Place against the virtually updated cluster state
+            shadow_target = self.find_target_node(vm_to_migrate, shadow_targets)
+            if not shadow_target:
+                logging.warning(t("node_no_target", vm_name=vm_to_migrate.name))
+                continue
+
+            # Reserve the VM's footprint on the shadow so later plans see it
+            shadow_target.cpu_used += vm_to_migrate.cpu_cores
+            shadow_target.memory_used_mb += vm_to_migrate.memory_mb
+            shadow_target.vm_count += 1
+
+            plans.append(
+                (vm_to_migrate, source_node, real_target_by_id[shadow_target.id])
+            )
+
+        return plans
+
+    async def _migrate_with_limit(
+        self, vm: VMInfo, source_node: NodeInfo, target_node: NodeInfo
+    ) -> bool:
+        """Run one planned migration under the concurrency semaphore"""
+        assert self._migration_semaphore is not None  # Created by run_once()
+        async with self._migration_semaphore:
+            return await self.migrate_vm(vm, source_node, target_node)
+
+    @staticmethod
+    async def _call_api(func, *args):
+        """Run a blocking API call in a worker thread
+
+        The requests-based client is shared with the synchronous path, so the
+        async cycle offloads its calls to the default executor instead of
+        stalling the event loop (and with it SSH monitoring and Telegram
+        notifications) for the duration of each HTTP round-trip.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def stop(self) -> None:
+        """Request the continuous balancing loop to stop"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def _wait_for_next_cycle(self, timeout: float) -> bool:
+        """Wait until the next cycle is due, returns True if stop was requested"""
+        assert self._stop_event is not None  # Created by run() before the loop
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def run(self) -> None:
         """Run continuous balancing loop"""
         logging.info(
@@ -788,22 +1206,63 @@ class VMBalancer:
             f" {self.balance_interval}s)"
         )
 
-        while True:
+        self._stop_event = asyncio.Event()
+        consecutive_failures = 0
+        consecutive_idle_cycles = 0
+
+        # Stop promptly on SIGTERM/SIGINT instead of sleeping out the rest of
+        # the interval; signal handlers on the loop are not available
+        # everywhere (e.g. Windows), so fall back to KeyboardInterrupt there
+        loop = asyncio.get_running_loop()
+        registered_signals = []
+        for sig in (signal.SIGTERM, signal.SIGINT):
             try:
-                await self.run_once()
+                loop.add_signal_handler(sig, self.stop)
+                registered_signals.append(sig)
+            except (NotImplementedError, RuntimeError):
+                break
 
-                logging.info(
-                    f"Waiting {self.balance_interval} seconds until next cycle..."
-                )
-                await asyncio.sleep(self.balance_interval)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    migrations = await self.run_once()
+                    consecutive_failures = 0
+
+                    # Adapt the pace to cluster activity: react quickly while
+                    # migrations are still happening, back off exponentially
+                    # (capped) once the clusters have settled
+                    if migrations:
+                        consecutive_idle_cycles = 0
+                        next_interval = self.min_balance_interval
+                    else:
+                        consecutive_idle_cycles += 1
+                        next_interval = min(
+                            self.balance_interval
+                            * 2 ** min(consecutive_idle_cycles - 1, 4),
+                            self.max_balance_interval,
+                        )
 
-            except KeyboardInterrupt:
-                logging.info("Received keyboard interrupt, stopping...")
-                break
-            except Exception as e:
-                logging.error(f"Error in main loop: {e}")
-                logging.info(f"Waiting {self.balance_interval} seconds before retry...")
-                await asyncio.sleep(self.balance_interval)
+                    logging.info(f"Waiting {next_interval} seconds until next cycle...")
+                    if await self._wait_for_next_cycle(next_interval):
+                        break
+
+                except KeyboardInterrupt:
+                    logging.info("Received keyboard interrupt, stopping...")
+                    break
+                except Exception:
+                    # Back off exponentially on repeated failures so a broken
+                    # endpoint (e.g. expired auth) is not hammered every interval
+                    consecutive_failures += 1
+                    retry_interval = min(
+                        self.balance_interval * 2 ** (consecutive_failures - 1), 3600
+                    )
+                    logging.exception("Error in main loop")
+                    logging.info(f"Waiting {retry_interval} seconds before retry...")
+                    if await self._wait_for_next_cycle(retry_interval):
+                        break
+        finally:
+            for sig in registered_signals:
+                loop.remove_signal_handler(sig)
 
     async def migrate_vm(
         self, vm: VMInfo, source_node: NodeInfo, target_node: NodeInfo
@@ -850,10 +1309,14 @@ class VMBalancer:
             # Real migration - track start time for duration calculation
             migration_start_time = time.time()
 
-            if self.api.migrate_vm(vm.id, target_node.id, self.migration_timeout):
+            if await self._call_api(
+                self.api.migrate_vm, vm.id, target_node.id, self.migration_timeout
+            ):
                 migration_duration = time.time() - migration_start_time
                 logging.info(t("migration_success", vm_name=vm.name))
-                self.migration_history[vm.id] = datetime.now()
+                self.migration_history[vm.id] = time.monotonic()
+                self._recently_migrated_ids.add(vm.id)
+                self._state_cache.invalidate()
 
                 # Notify successful migration
                 if self.telegram_notifier:
@@ -870,8 +1333,9 @@ class VMBalancer:
                     t("migration_failed", vm_name=vm.name, error="Migration failed")
                 )
                 # Add to blacklist to prevent retry attempts for 24 hours
-                self.migration_blacklist[vm.id] = datetime.now()
-                logging.debug(f"VM {vm.name} added to migration blacklist")
+                self.migration_blacklist[vm.id] = time.monotonic()
+                self._blacklisted_ids.add(vm.id)
+                logging.debug("VM %s added to migration blacklist", vm.name)
 
                 # Notify failed migration
                 if self.telegram_notifier:
@@ -8,7 +8,7 @@ import os
 import sys
 from pathlib import Path
 
-from . import VMBalancer, __version__
+from . import __version__
 from .utils.i18n import set_locale, t
 
 # Добавляем корневую директорию проекта в путь Python
@@ -64,6 +64,9 @@ def main():
         return 1
 
     try:
+        # Импортируем здесь, чтобы --help/--version не тянули тяжёлые зависимости
+        from . import VMBalancer
+
         # Создаем балансировщик
         balancer = VMBalancer(
             config_path=args.config, dry_run=args.dry_run, verbose=args.verbose
@@ -77,6 +80,14 @@ def main():
             cluster_ids = [int(x.strip()) for x in args.cluster_ids.split(",")]
             balancer.cluster_ids = cluster_ids
 
+        # Используем uvloop, если он установлен (ускоряет I/O-bound цикл)
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
         print(f"🚀 {t('balancer_starting')}...")
         print(f"📁 Configuration: {args.config}")
         print(
@@ -2,8 +2,13 @@
 Node data model for VM Balancer
 """
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property
+from typing import Optional, Tuple
+
+# Matches the numeric part of version strings like "6.2.0" or "7.1.0-1ubuntu1"
+_QEMU_VERSION_RE = re.compile(r"(\d+(?:\.\d+)*)")
 
 
 @dataclass
@@ -29,6 +34,36 @@ class NodeInfo:
     load_average_5m: Optional[float] = None  # 5-minute load average from SSH
     load_average_15m: Optional[float] = None  # 15-minute load average from SSH
     ssh_available: bool = False  # Whether SSH monitoring is available
+    # Exclusion flags precomputed per cycle by VMBalancer.prepare_nodes()
+    excluded_source: bool = False  # Excluded as a migration source
+    excluded_target: bool = False  # Excluded as a migration target
+
+    @cached_property
+    def qemu_version_tuple(self) -> Optional[Tuple[int, ...]]:
+        """QEMU version parsed once into a comparable tuple
+
+        Returns None when no version is known; unparsable strings map to
+        (0,), matching VMManagerAPI.compare_qemu_versions semantics.
+        """
+        if not self.qemu_version:
+            return None
+        match = _QEMU_VERSION_RE.match(self.qemu_version.strip())
+        if not match:
+            return (0,)
+        return tuple(int(part) for part in match.group(1).split("."))
+
+    @cached_property
+    def qemu_version_key(self) -> Optional[int]:
+        """QEMU version packed into a single int for O(1) comparisons
+
+        major/minor/patch are folded into one integer so compatibility checks
+        compare two ints instead of allocating and walking tuples.
+        """
+        parsed = self.qemu_version_tuple
+        if parsed is None:
+            return None
+        major, minor, patch = (parsed + (0, 0, 0))[:3]
+        return major * 1_000_000 + minor * 1_000 + patch
 
     @property
     def cpu_usage_percent(self) -> float:
@@ -78,6 +113,11 @@ class NodeInfo:
             return self.load_average_1m / self.cpu_total if self.cpu_total > 0 else 0.0
         return self.cpu_allocation_ratio
 
+    @property
+    def combined_load_score(self) -> float:
+        """Combined CPU and memory load score used to rank overloaded nodes"""
+        return self.cpu_load_score + (self.memory_usage_percent / 100)
+
     @property
     def memory_usage_percent(self) -> float:
         """Calculate memory usage percentage"""
@@ -17,6 +17,11 @@ class VMInfo:
     state: str
     can_migrate: bool = True
 
+    @property
+    def migration_size_score(self) -> float:
+        """Combined resource size used to prefer smaller VMs for migration"""
+        return self.cpu_cores + (self.memory_mb / 1024)
+
     def __str__(self) -> str:
         return f"VM {self.name} (ID: {self.id}) on node {self.node_id}"
 
@@ -4,13 +4,21 @@ Environment configuration utilities
 
 import json
 import os
-from typing import List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
 from dotenv import load_dotenv
 
 
+@lru_cache(maxsize=None)
 def get_env_value(key: str, default: str = "") -> str:
-    """Get environment variable value, removing comments"""
+    """Get environment variable value, removing comments
+
+    Cached for the lifetime of the process: configuration is loaded once at
+    startup and never changes during a run, so repeated lookups skip the
+    os.getenv call and comment stripping. Call get_env_value.cache_clear()
+    if the environment is ever reloaded.
+    """
     value = os.getenv(key, default)
     # Remove comments from environment variables
     if "#" in value:
@@ -51,51 +59,99 @@ def get_env_bool(key: str, default: bool = False) -> bool:
     return value.lower() in ("true", "1", "yes", "on")
 
 
+# Single authoritative table of settings: (attribute, env key, parser, default).
+# EnvConfig walks it in one pass instead of one hand-written call per setting;
+# the class-level annotations on EnvConfig mirror this table so type checkers
+# still see the full config surface.
+_SETTINGS_SCHEMA: List[Tuple[str, str, Callable[[str, Any], Any], Any]] = [
+    # VMManager connection settings
+    ("vmmanager_host", "VMMANAGER_HOST", get_env_value, "https://localhost"),
+    ("vmmanager_username", "VMMANAGER_USERNAME", get_env_value, "admin"),
+    ("vmmanager_password", "VMMANAGER_PASSWORD", get_env_value, ""),
+    # Balance settings
+    ("balance_interval", "BALANCE_INTERVAL", get_env_int, 600),
+    ("min_balance_interval", "MIN_BALANCE_INTERVAL", get_env_int, 60),
+    ("max_balance_interval", "MAX_BALANCE_INTERVAL", get_env_int, 3600),
+    ("cluster_ids", "CLUSTER_IDS", get_env_list, ""),
+    ("max_migrations_per_cycle", "MAX_MIGRATIONS_PER_CYCLE", get_env_int, 1),
+    ("migration_timeout", "MIGRATION_TIMEOUT", get_env_int, 1800),
+    ("state_ttl", "STATE_TTL", get_env_int, 60),
+    ("max_parallel_clusters", "MAX_PARALLEL_CLUSTERS", get_env_int, 4),
+    ("migration_parallelism", "MIGRATION_PARALLELISM", get_env_int, 4),
+    ("max_vm_memory_to_migrate_mb", "MAX_VM_MEMORY_TO_MIGRATE_MB", get_env_int, 0),
+    # Thresholds
+    ("cpu_overload_threshold", "CPU_OVERLOAD_THRESHOLD", get_env_float, 7.0),
+    ("memory_overload_threshold", "MEMORY_OVERLOAD_THRESHOLD", get_env_float, 70.0),
+    ("cpu_target_threshold", "CPU_TARGET_THRESHOLD", get_env_float, 6.0),
+    ("memory_target_threshold", "MEMORY_TARGET_THRESHOLD", get_env_float, 80.0),
+    # Node exclusions
+    ("exclude_source_nodes", "EXCLUDE_SOURCE_NODES", get_env_list, ""),
+    ("exclude_target_nodes", "EXCLUDE_TARGET_NODES", get_env_list, ""),
+    # Logging
+    ("log_level", "LOG_LEVEL", get_env_value, "INFO"),
+    # SSL verification
+    ("verify_ssl", "VERIFY_SSL", get_env_bool, True),
+    # SSH monitoring
+    ("ssh_enabled", "SSH_ENABLED", get_env_bool, False),
+    ("ssh_username", "SSH_USERNAME", get_env_value, ""),
+    ("ssh_private_key_path", "SSH_PRIVATE_KEY_PATH", get_env_value, ""),
+    ("ssh_password", "SSH_PASSWORD", get_env_value, ""),
+    ("ssh_timeout", "SSH_TIMEOUT", get_env_int, 10),
+    # Telegram notifications
+    ("telegram_bot_token", "TELEGRAM_BOT_TOKEN", get_env_value, ""),
+    ("telegram_chat_id", "TELEGRAM_CHAT_ID", get_env_value, ""),
+]
+
+
 class EnvConfig:
     """Configuration loader from environment file"""
 
+    # Declared per setting (matching _SETTINGS_SCHEMA) so the attributes
+    # assigned via setattr below remain statically visible
+    vmmanager_host: str
+    vmmanager_username: str
+    vmmanager_password: str
+    balance_interval: int
+    min_balance_interval: int
+    max_balance_interval: int
+    cluster_ids: List[str]
+    max_migrations_per_cycle: int
+    migration_timeout: int
+    state_ttl: int
+    max_parallel_clusters: int
+    migration_parallelism: int
+    max_vm_memory_to_migrate_mb: int
+    cpu_overload_threshold: float
+    memory_overload_threshold: float
+    cpu_target_threshold: float
+    memory_target_threshold: float
+    exclude_source_nodes: List[str]
+    exclude_target_nodes: List[str]
+    log_level: str
+    verify_ssl: bool
+    ssh_enabled: bool
+    ssh_username: str
+    ssh_private_key_path: str
+    ssh_password: str
+    ssh_timeout: int
+    telegram_bot_token: str
+    telegram_chat_id: str
+    ssh_hosts_mapping: Dict[str, str]
+
     def __init__(self, config_path: str = ".env"):
         """Load configuration from file"""
+        # Drop values cached from a previously loaded environment so a second
+        # EnvConfig with a different config file sees the fresh load; lookups
+        # are still cached for the rest of the run
+        get_env_value.cache_clear()
+
         if os.path.exists(config_path):
             load_dotenv(config_path)
 
-        # VMManager connection settings
-        self.vmmanager_host = get_env_value("VMMANAGER_HOST", "https://localhost")
-        self.vmmanager_username = get_env_value("VMMANAGER_USERNAME", "admin")
-        self.vmmanager_password = get_env_value("VMMANAGER_PASSWORD", "")
-
-        # Balance settings
-        self.balance_interval = get_env_int("BALANCE_INTERVAL", 600)
-        self.cluster_ids = get_env_list("CLUSTER_IDS")
-        self.max_migrations_per_cycle = get_env_int("MAX_MIGRATIONS_PER_CYCLE", 1)
-        self.migration_timeout = get_env_int("MIGRATION_TIMEOUT", 1800)
-
-        # Thresholds
-        self.cpu_overload_threshold = get_env_float("CPU_OVERLOAD_THRESHOLD", 7.0)
-        self.memory_overload_threshold = get_env_float(
-            "MEMORY_OVERLOAD_THRESHOLD", 70.0
-        )
-        self.cpu_target_threshold = get_env_float("CPU_TARGET_THRESHOLD", 6.0)
-        self.memory_target_threshold = get_env_float("MEMORY_TARGET_THRESHOLD", 80.0)
-
-        # Node exclusions
-        self.exclude_source_nodes = get_env_list("EXCLUDE_SOURCE_NODES")
-        self.exclude_target_nodes = get_env_list("EXCLUDE_TARGET_NODES")
-
-        # Logging
-        self.log_level = get_env_value("LOG_LEVEL", "INFO")
-
-        # SSL verification
-        self.verify_ssl = get_env_bool("VERIFY_SSL", True)
-
-        # SSH monitoring
-        self.ssh_enabled = get_env_bool("SSH_ENABLED", False)
-        self.ssh_username = get_env_value("SSH_USERNAME", "")
-        self.ssh_private_key_path = get_env_value("SSH_PRIVATE_KEY_PATH", "")
-        self.ssh_password = get_env_value("SSH_PASSWORD", "")
-        self.ssh_timeout = get_env_int("SSH_TIMEOUT", 10)
-
-        # SSH hosts mapping (JSON format)
+        for attr, key, parser, default in _SETTINGS_SCHEMA:
+            setattr(self, attr, parser(key, default))
+
+        # SSH hosts mapping (JSON format) needs custom parsing
         ssh_mapping_str = get_env_value("SSH_HOSTS_MAPPING", "{}")
         try:
             self.ssh_hosts_mapping = (
@@ -103,7 +159,3 @@ class EnvConfig:
             )
         except json.JSONDecodeError:
             self.ssh_hosts_mapping = {}
-
-        # Telegram notifications
-        self.telegram_bot_token = get_env_value("TELEGRAM_BOT_TOKEN", "")
-        self.telegram_chat_id = get_env_value("TELEGRAM_CHAT_ID", "")